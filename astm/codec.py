@@ -15,10 +15,6 @@ from .constants import (
     STX, ETX, ETB, CR, LF, CRLF,
     FIELD_SEP, COMPONENT_SEP, RECORD_SEP, REPEAT_SEP, ENCODING
 )
-try:
-    from itertools import izip_longest
-except ImportError:  # Python 3
-    from itertools import zip_longest as izip_longest
 import logging
 
 log = logging.getLogger(__name__)
@@ -54,8 +50,7 @@ def decode(data, encoding=ENCODING):
     if data.startswith(STX):  # may be decode message \x02...\x03CS\r\n
         seq, records, cs = decode_message(data, encoding)
         return records
-    byte = data[:1].decode()
-    if  byte.isdigit():
+    if data[:1].isdigit():
         seq, records = decode_frame(data, encoding)
         return records
     return [decode_record(data, encoding)]
@@ -123,7 +118,7 @@ def decode_frame(frame, encoding):
 
     seq_byte = frame[:1]
     if seq_byte.isdigit():
-        seq = int(seq_byte.decode('ascii'))
+        seq = int(seq_byte)
         records_data = frame[1:]
     else:
         seq = None
@@ -138,20 +133,24 @@ def decode_frame(frame, encoding):
 def decode_record(record, encoding):
     """Decodes ASTM record message."""
     fields = []
+    # Look for nested delimiters once per record, so fields of plain records
+    # are not scanned again for each of them.
+    repeats = REPEAT_SEP in record
+    components = COMPONENT_SEP in record
     for item in record.split(FIELD_SEP):
-        if REPEAT_SEP in item:
+        if repeats and REPEAT_SEP in item:
             item = decode_repeated_component(item, encoding)
-        elif COMPONENT_SEP in item:
+        elif components and COMPONENT_SEP in item:
             item = decode_component(item, encoding)
         else:
             item = item.decode(encoding)
-        fields.append([None, item][bool(item)])
+        fields.append(item or None)
     return fields
 
 
 def decode_component(field, encoding):
     """Decodes ASTM field component."""
-    return [[None, item.decode(encoding)][bool(item)]
+    return [item.decode(encoding) if item else None
             for item in field.split(COMPONENT_SEP)]
 
 
@@ -295,13 +294,11 @@ def make_checksum(message):
     """
     if not isinstance(message[0], int):
         message = map(ord, message)
-    return hex(sum(message) & 0xFF)[2:].upper().zfill(2).encode()
+    return b'%02X' % (sum(message) & 0xFF)
 
 
 def make_chunks(s, n):
-    iter_bytes = (s[i:i + 1] for i in range(len(s)))
-    return [b''.join(item)
-            for item in izip_longest(*[iter_bytes] * n, fillvalue=b'')]
+    return [s[i:i + n] for i in range(0, len(s), n)]
 
 
 def split(msg, size):
@@ -341,15 +338,16 @@ def join(chunks):
     :param chunks: List of chunks as `bytes`.
     :type chunks: iterable
     """
-    msg = b'1' + b''.join(c[2:-5] for c in chunks) + ETX
+    items = [b'1']
+    items.extend(c[2:-5] for c in chunks)
+    items.append(ETX)
+    msg = b''.join(items)
     return b''.join([STX, msg, make_checksum(msg), CRLF])
 
 
 def is_chunked_message(message):
     """Checks plain message for chunked byte."""
     length = len(message)
-    if len(message) < 5:
-        return False
-    if ETB not in message:
+    if length < 5:
         return False
-    return message.index(ETB) == length - 5
+    return message.find(ETB) == length - 5
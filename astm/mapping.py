@@ -72,16 +72,16 @@ class MetaMapping(type):
 
     def __new__(mcs, name, bases, d):
         fields = []
-        names = []
+        positions = {}
         def merge_fields(items):
             for n, field in items:
                 if field.name is None:
                     field.name = n
-                if n not in names:
+                if n not in positions:
+                    positions[n] = len(fields)
                     fields.append((n, field))
-                    names.append(n)
                 else:
-                    fields[names.index(n)] = (n, field)
+                    fields[positions[n]] = (n, field)
         for base in bases:
             if hasattr(base, '_fields'):
                 merge_fields(base._fields)
@@ -123,7 +123,9 @@ class Mapping(metaclass=MetaMapping):
         return newcls
 
     def __getitem__(self, key):
-        return self.values()[key]
+        if isinstance(key, slice):
+            return self.values()[key]
+        return getattr(self, self._fields[key][0])
 
     def __setitem__(self, key, value):
         setattr(self, self._fields[key][0], value)
@@ -160,7 +162,7 @@ class Mapping(metaclass=MetaMapping):
         return [key for key, field in self._fields]
 
     def values(self):
-        return [getattr(self, key) for key in self.keys()]
+        return [getattr(self, key) for key, field in self._fields]
 
     def items(self):
         return [(key, getattr(self, key)) for key, field in self._fields]
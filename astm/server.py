@@ -58,9 +58,9 @@ class BaseRecordsDispatcher(object):
         
         :return: High-level wrapper or raw record.
         """
-        rtype = record[0]
-        if rtype in self.wrappers:
-            return self.wrappers[rtype](*record)
+        wrapper = self.wrappers.get(record[0])
+        if wrapper is not None:
+            return wrapper(*record)
         return record
 
     def _default_handler(self, record):
@@ -12,12 +12,12 @@ from astm import codec
 from astm.constants import STX, ETX, ETB, CR, LF, CRLF
 
 def f(s, e='latin-1'):
-    return s.format(STX=str(STX),
-                       ETX=str(ETX),
-                       ETB=str(ETB),
-                       CR=str(CR),
-                       LF=str(LF),
-                       CRLF=str(CRLF)).encode(e)
+    return s.format(STX=STX.decode('latin-1'),
+                    ETX=ETX.decode('latin-1'),
+                    ETB=ETB.decode('latin-1'),
+                    CR=CR.decode('latin-1'),
+                    LF=LF.decode('latin-1'),
+                    CRLF=CRLF.decode('latin-1')).encode(e)
 
 class DecodeTestCase(unittest.TestCase):
 
@@ -28,7 +28,7 @@ class DecodeTestCase(unittest.TestCase):
 
     def test_decode_message_with_nonascii(self):
         msg = f('{STX}1Й|Ц|У|К{CR}{ETX}F1{CRLF}', 'cp1251')
-        res = [[u('Й'), u('Ц'), u('У'), u('К')]]
+        res = [['Й', 'Ц', 'У', 'К']]
         self.assertEqual(res, codec.decode(msg, 'cp1251'))
 
     def test_decode_frame(self):
@@ -41,6 +41,11 @@ class DecodeTestCase(unittest.TestCase):
         res = [['A', 'B', 'C', 'D']]
         self.assertEqual(res, codec.decode(msg))
 
+    def test_decode_record_with_nonascii_start(self):
+        msg = f('Й|Ц', 'cp1251')
+        res = [['Й', 'Ц']]
+        self.assertEqual(res, codec.decode(msg, 'cp1251'))
+
 
 class DecodeMessageTestCase(unittest.TestCase):
 
@@ -49,17 +54,21 @@ class DecodeMessageTestCase(unittest.TestCase):
         res = (1, [['A', 'B', 'C', 'D']], 'BF')
         self.assertEqual(res, codec.decode_message(msg, 'ascii'))
 
-    def test_fail_decome_message_with_wrong_checksumm(self):
+    def test_warn_decode_message_with_wrong_checksumm(self):
         msg = f('{STX}1A|B|C|D{CR}{ETX}00{CRLF}')
-        self.assertRaises(AssertionError, codec.decode_message, msg, 'ascii')
+        res = (1, [['A', 'B', 'C', 'D']], '00')
+        with self.assertLogs('astm.codec', 'WARNING'):
+            self.assertEqual(res, codec.decode_message(msg, 'ascii'))
+
+    def test_decode_message_without_crlf(self):
+        msg = f('{STX}1A|B|C|D{CR}{ETX}BF')
+        res = (1, [['A', 'B', 'C', 'D']], 'BF')
+        self.assertEqual(res, codec.decode_message(msg, 'ascii'))
 
     def test_fail_decode_invalid_message(self):
         msg = f('A|B|C|D')
         self.assertRaises(ValueError, codec.decode_message, msg, 'ascii')
 
-        msg = f('{STX}1A|B|C|D{CR}{ETX}BF')
-        self.assertRaises(ValueError, codec.decode_message, msg, 'ascii')
-
         msg = f('1A|B|C|D{CR}{ETX}BF{CRLF}')
         self.assertRaises(ValueError, codec.decode_message, msg, 'ascii')
 
@@ -96,6 +105,11 @@ class DecodeRecordTestCase(unittest.TestCase):
         res = ['A', [['B', 'C'], ['D', 'E']], 'F']
         self.assertEqual(res, codec.decode_record(msg, 'ascii'))
 
+    def test_decode_with_mixed_components(self):
+        msg = f(r'A|B^C\D^E|F^G|H')
+        res = ['A', [['B', 'C'], ['D', 'E']], ['F', 'G'], 'H']
+        self.assertEqual(res, codec.decode_record(msg, 'ascii'))
+
     def test_decode_none_values_for_missed_ones(self):
         msg = f('A|||B')
         res = ['A', None, None, 'B']
@@ -107,7 +121,7 @@ class DecodeRecordTestCase(unittest.TestCase):
 
     def test_decode_nonascii_chars_as_unicode(self):
         msg = f('привет|мир|!', 'utf8')
-        res = [u('привет'), u('мир'), '!']
+        res = ['привет', 'мир', '!']
         self.assertEqual(res, codec.decode_record(msg, 'utf8'))
 
 
@@ -203,6 +217,17 @@ class ChunkedEncodingTestCase(unittest.TestCase):
         msg = codec.join(chunks)
         self.assertEqual(codec.decode(msg), recs)
 
+    def test_join_raw_chunks(self):
+        chunks = [f('{STX}1A|B{ETB}47{CRLF}'),
+                  f('{STX}2|C{CR}{ETX}01{CRLF}')]
+        msg = codec.join(chunks)
+        self.assertEqual(f('{STX}1A|B|C{CR}{ETX}FF{CRLF}'), msg)
+
+    def test_make_chunks(self):
+        res = codec.make_chunks(b'abcdefg', 3)
+        self.assertEqual([b'abc', b'def', b'g'], res)
+        self.assertEqual([b'ab'], codec.make_chunks(b'ab', 5))
+
     def test_encode_as_single_message(self):
         res = codec.encode_message(2, [['A', 0]], 'ascii')
         self.assertEqual(f('{STX}2A|0{CR}{ETX}2F{CRLF}'), res)
@@ -214,6 +239,9 @@ class ChunkedEncodingTestCase(unittest.TestCase):
         msg = f('{STX}2A|0{CR}{ETX}2F{CRLF}')
         self.assertFalse(codec.is_chunked_message(msg))
 
+        msg = f('{STX}2A{ETB}|0{CR}{ETX}2F{CRLF}')
+        self.assertFalse(codec.is_chunked_message(msg))
+
 
 class ChecksummTestCase(unittest.TestCase):
 
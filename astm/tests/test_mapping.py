@@ -686,6 +686,13 @@ class MappingTestCase(unittest.TestCase):
         obj = self.Dummy('foo', [3, 2, 1])
         self.assertEqual(obj[1][0], 3)
 
+    def test_getitem_slice_and_negative_index(self):
+        obj = self.Dummy('foo', [3, 2, 1])
+        self.assertEqual(obj.bar[1:3], obj.bar.values()[1:3])
+        self.assertEqual(obj.bar[1:3], [2, 1])
+        self.assertEqual(obj.bar[-1], obj.bar.values()[-1])
+        self.assertEqual(obj[-1], obj.values()[-1])
+
     def test_setitem(self):
         obj = self.Dummy('foo', [3, 2, 1])
         obj[1][0] = 42